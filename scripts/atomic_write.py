@@ -0,0 +1,32 @@
+"""
+Atomic file writes shared by the story remediation and simplification scripts.
+"""
+
+import os
+
+
+def write_file(filepath, data: bytes) -> None:
+    """Write data to filepath atomically, bypassing the text I/O layer.
+
+    The bytes go to "<filepath>.tmp" first and are moved over filepath with
+    os.replace, so an interrupted write never leaves a truncated file. If the write
+    fails, the .tmp file is removed before the error is re-raised.
+    """
+    tmp_path = os.fspath(filepath) + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        # Callers carry on after a failed story, so don't leave the
+        # partial .tmp file behind in the story tree
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
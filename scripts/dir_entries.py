@@ -0,0 +1,11 @@
+"""
+Sorted directory listings shared by the epic/story/task tree walkers.
+"""
+
+import os
+
+
+def sorted_entries(path) -> list[os.DirEntry]:
+    """List a directory's entries sorted by name."""
+    with os.scandir(path) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
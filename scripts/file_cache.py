@@ -0,0 +1,25 @@
+"""
+Per-file run caches shared by the story remediation and artifact update scripts.
+"""
+
+import json
+
+from atomic_write import write_file
+
+
+def load_cache(cache_file, fingerprint: str) -> dict:
+    """Load the per-file cache, discarding it if the fingerprint has changed."""
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache.get("files", {})
+
+
+def save_cache(cache_file, fingerprint: str, files: dict) -> None:
+    """Persist the per-file cache atomically."""
+    data = json.dumps({"fingerprint": fingerprint, "files": files}, indent=2)
+    write_file(cache_file, data.encode("utf-8"))
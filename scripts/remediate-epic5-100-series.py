@@ -4,10 +4,15 @@ Remediate EPIC-5 stories 100-123 with meaningful AC content and Technical Notes.
 """
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 EPIC5_DIR = Path("/Users/phillipboles/Development/armor-argus/.bmad/epics/EPIC-5/stories")
 
+# Stories handed to each worker process per batch
+CHUNK_SIZE = 4
+
 # Map AC titles to meaningful GIVEN/WHEN/THEN content based on common UI patterns
 AC_MAPPINGS = {
     # Input/Form patterns
@@ -78,94 +83,116 @@ AC_MAPPINGS = {
     "integration": "**GIVEN** the user is setting up an integration\n**WHEN** credentials are entered\n**THEN** connection validation occurs automatically\n**AND** success or failure is clearly indicated",
 }
 
-def get_ac_content(ac_title: str, story_title: str) -> str:
+# Story title keyword -> UI area directory used for Technical Notes key files.
+# Areas are listed in priority order; the first area with a keyword in the
+# title wins.
+CATEGORY_KEYWORDS = {
+    "dashboard": "dashboard", "findings": "dashboard", "risk": "dashboard", "overview": "dashboard",
+    "policy": "policies", "cedar": "policies", "approval": "policies",
+    "remediation": "remediation", "queue": "remediation", "execution": "remediation",
+    "onboarding": "onboarding", "welcome": "onboarding", "setup": "onboarding", "wizard": "onboarding",
+    "settings": "settings", "dark mode": "settings", "keyboard": "settings", "accessibility": "settings",
+    "graph": "graph", "attack path": "graph", "visualization": "graph",
+}
+
+TITLE_RE = re.compile(r'^# UX-\d+: (.+)$', re.MULTILINE)
+AC_HEADER_RE = re.compile(r'### AC\d+: (.+)')
+# Line prefixes that end a placeholder AC body
+AC_BODY_END = ("---", "### AC", "## ")
+DEPENDS_RE = re.compile(r'\| Depends On \| ([^\|]+) \|')
+BLOCKS_RE = re.compile(r'\| Blocks \| ([^\|]+) \|')
+
+@lru_cache(maxsize=512)
+def _classify(ac_lower: str):
+    """Return the first AC_MAPPINGS key (in dict order) found in ac_lower, or None."""
+    return next((pattern for pattern in AC_MAPPINGS if pattern in ac_lower), None)
+
+def _categorize(title_lower: str):
+    """Return the UI area directory for a lowercased story title, or None."""
+    return next(
+        (category for keyword, category in CATEGORY_KEYWORDS.items() if keyword in title_lower),
+        None,
+    )
+
+def get_ac_content(ac_title: str, story_title_lower: str) -> str:
     """Generate meaningful AC content based on AC title patterns."""
     ac_lower = ac_title.lower()
 
     # Find best matching pattern
-    for pattern, content in AC_MAPPINGS.items():
-        if pattern in ac_lower:
-            return content
+    pattern = _classify(ac_lower)
+    if pattern is not None:
+        return AC_MAPPINGS[pattern]
 
     # Fallback: generate generic but meaningful content
-    return f"**GIVEN** the user is on the {story_title.lower()} component\n**WHEN** the {ac_title.lower()} element is interacted with\n**THEN** the expected behavior is executed successfully\n**AND** appropriate user feedback is provided"
+    return f"**GIVEN** the user is on the {story_title_lower} component\n**WHEN** the {ac_lower} element is interacted with\n**THEN** the expected behavior is executed successfully\n**AND** appropriate user feedback is provided"
+
+def rewrite_ac_blocks(lines: list, story_title_lower: str):
+    """Replace placeholder AC bodies in a single pass over the story lines.
+
+    An AC block is a "### ACn: title" line, a blank line and a body starting
+    with **GIVEN**; the body runs up to the next rule, AC or section heading.
+    Returns the output lines and the indices of the "## References" headings
+    in them, where a Technical Notes section can be inserted.
+    """
+    out = []
+    references_at = []
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        header = AC_HEADER_RE.search(line) if "### AC" in line else None
+        if header and i + 2 < n and not lines[i + 1] and lines[i + 2].startswith("**GIVEN**"):
+            # The body holds at least one character after **GIVEN**
+            end = i + 3 if lines[i + 2] != "**GIVEN**" else i + 4
+            while end < n and not lines[end].startswith(AC_BODY_END):
+                end += 1
+            if end < n:
+                out += (line, "", get_ac_content(header.group(1).strip(), story_title_lower), "")
+                i = end
+                continue
+        if (line == "## References" and 0 < i < n - 1
+                and not (references_at and references_at[-1] == len(out) - 1)):
+            references_at.append(len(out))
+        out.append(line)
+        i += 1
+    return out, references_at
 
 def remediate_story(story_path: Path):
-    """Remediate a single story file."""
-    with open(story_path, 'r') as f:
-        content = f.read()
+    """Remediate a single story file.
+
+    Returns whether the story was rewritten and its progress line; printing is
+    left to main so output stays in file order when run in worker processes.
+    """
+    content = story_path.read_text(encoding='utf-8')
 
     # Skip if already has good ACs (no placeholder content)
     if "the specified action is performed" not in content:
-        print(f"  Skipping {story_path.name} - already remediated")
-        return False
+        return False, f"  Skipping {story_path.name} - already remediated"
 
     # Extract story title from header
-    title_match = re.search(r'^# UX-\d+: (.+)$', content, re.MULTILINE)
+    title_match = TITLE_RE.search(content)
     story_title = title_match.group(1) if title_match else "Unknown"
+    story_title_lower = story_title.lower()
 
     # Find all AC sections and replace their content
-    ac_pattern = r'(### AC\d+: ([^\n]+)\n\n)\*\*GIVEN\*\*.+?(?=\n---|\n### AC|\n## )'
-
-    def replace_ac(match):
-        ac_header = match.group(1)
-        ac_title = match.group(2).strip()
-        new_content = get_ac_content(ac_title, story_title)
-        return f"{ac_header}{new_content}\n"
-
-    new_content = re.sub(ac_pattern, replace_ac, content, flags=re.DOTALL)
+    out, references_at = rewrite_ac_blocks(content.split("\n"), story_title_lower)
+    new_content = "\n".join(out)
 
     # Add Technical Notes section if missing
     if "## Technical Notes" not in new_content:
-        # Determine appropriate key files based on story content
-        story_num = re.search(r'UX-(\d+)', content).group(1)
-
         # Generate key files based on story title patterns
-        key_files = []
-        if any(x in story_title.lower() for x in ['dashboard', 'findings', 'risk', 'overview']):
-            key_files = [
-                "submodules/argus-ui/apps/argus-ui/src/app/dashboard/",
-                "submodules/argus-ui/libs/ui-components/src/components/dashboard/"
-            ]
-        elif any(x in story_title.lower() for x in ['policy', 'cedar', 'approval']):
-            key_files = [
-                "submodules/argus-ui/apps/argus-ui/src/app/policies/",
-                "submodules/argus-ui/libs/ui-components/src/components/policies/"
-            ]
-        elif any(x in story_title.lower() for x in ['remediation', 'queue', 'execution']):
-            key_files = [
-                "submodules/argus-ui/apps/argus-ui/src/app/remediation/",
-                "submodules/argus-ui/libs/ui-components/src/components/remediation/"
-            ]
-        elif any(x in story_title.lower() for x in ['onboarding', 'welcome', 'setup', 'wizard']):
-            key_files = [
-                "submodules/argus-ui/apps/argus-ui/src/app/onboarding/",
-                "submodules/argus-ui/libs/ui-components/src/components/onboarding/"
-            ]
-        elif any(x in story_title.lower() for x in ['settings', 'dark mode', 'keyboard', 'accessibility']):
-            key_files = [
-                "submodules/argus-ui/apps/argus-ui/src/app/settings/",
-                "submodules/argus-ui/libs/ui-components/src/components/settings/"
-            ]
-        elif any(x in story_title.lower() for x in ['graph', 'attack path', 'visualization']):
-            key_files = [
-                "submodules/argus-ui/apps/argus-ui/src/app/graph/",
-                "submodules/argus-ui/libs/ui-components/src/components/graph/"
-            ]
-        else:
-            key_files = [
-                f"submodules/argus-ui/apps/argus-ui/src/app/{story_title.lower().replace(' ', '-')}/",
-                f"submodules/argus-ui/libs/ui-components/src/components/{story_title.lower().replace(' ', '-')}/"
-            ]
+        key_dir = _categorize(story_title_lower) or story_title_lower.replace(' ', '-')
+        key_files = [
+            f"submodules/argus-ui/apps/argus-ui/src/app/{key_dir}/",
+            f"submodules/argus-ui/libs/ui-components/src/components/{key_dir}/"
+        ]
 
         # Extract depends on and blocks
-        depends_match = re.search(r'\| Depends On \| ([^\|]+) \|', new_content)
-        blocks_match = re.search(r'\| Blocks \| ([^\|]+) \|', new_content)
+        depends_match = DEPENDS_RE.search(new_content)
+        blocks_match = BLOCKS_RE.search(new_content)
         depends_on = depends_match.group(1).strip() if depends_match else "-"
         blocks = blocks_match.group(1).strip() if blocks_match else "-"
 
-        tech_notes = f"""
-## Technical Notes
+        tech_notes = f"""## Technical Notes
 
 ### Key Files
 - `{key_files[0]}` - Main component directory
@@ -176,31 +203,40 @@ def remediate_story(story_path: Path):
 - Blocks: {blocks}
 
 ---
-
 """
         # Insert before References section
-        new_content = re.sub(
-            r'\n## References\n',
-            f'{tech_notes}## References\n',
-            new_content
-        )
-
-    with open(story_path, 'w') as f:
-        f.write(new_content)
-
-    print(f"  Remediated {story_path.name}")
-    return True
+        for index in reversed(references_at):
+            out.insert(index, tech_notes)
+        new_content = "\n".join(out)
+
+    if new_content == content:
+        return False, f"  Skipping {story_path.name} - no changes needed"
+
+    story_path.write_text(new_content, encoding='utf-8')
+    return True, f"  Remediated {story_path.name}"
+
+def find_stories(root: Path):
+    """Yield 1*/story-*.md files under root without Path.glob's per-entry fnmatch."""
+    with os.scandir(root) as story_dirs:
+        for story_dir in story_dirs:
+            if not story_dir.name.startswith("1") or not story_dir.is_dir():
+                continue
+            with os.scandir(story_dir.path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("story-") and entry.name.endswith(".md"):
+                        yield Path(entry.path)
 
 def main():
     print("Remediating EPIC-5 stories 100-123...")
 
     # Find all stories that need remediation
-    story_files = sorted(EPIC5_DIR.glob("1*/story-*.md"))
+    story_files = sorted(find_stories(EPIC5_DIR))
 
     remediated = 0
-    for story_file in story_files:
-        if remediate_story(story_file):
-            remediated += 1
+    with ProcessPoolExecutor() as executor:
+        for changed, line in executor.map(remediate_story, story_files, chunksize=CHUNK_SIZE):
+            print(line)
+            remediated += changed
 
     print(f"\nRemediated {remediated} stories")
 
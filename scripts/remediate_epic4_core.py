@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Core parsing and rendering for the EPIC-4 story remediation.
+
+Pure, fully annotated functions used by remediate-epic4-stories.py, kept in
+their own importable module so they can be compiled with mypyc
+(``mypyc scripts/remediate_epic4_core.py``). The driver script imports the
+compiled extension when present and this source otherwise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import operator
+import os
+import re
+import string
+import types
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable
+
+# Story metadata for better remediation, kept in a JSON sidecar so import
+# is a single C-level decode rather than executing a large dict literal
+METADATA_FILE = Path(__file__).parent / "epic4-story-metadata.json"
+STORY_METADATA = types.MappingProxyType(json.loads(METADATA_FILE.read_bytes()))
+
+# Fields the generators read from each STORY_METADATA entry
+METADATA_FIELDS: tuple[str, ...] = ("action", "benefit", "value", "metric", "research", "key_files", "deps")
+
+KNOWN_STORY_IDS: frozenset[str] = frozenset(STORY_METADATA)
+
+# Struct-of-arrays view of STORY_METADATA: one flat table per field the
+# generators read, so each lookup is a single dict probe keyed by story number.
+# An entry missing a field falls back to the generic content for that field.
+STORY_ACTIONS: dict[str, str] = {sid: meta["action"] for sid, meta in STORY_METADATA.items() if "action" in meta}
+STORY_BENEFITS: dict[str, str] = {sid: meta["benefit"] for sid, meta in STORY_METADATA.items() if "benefit" in meta}
+STORY_VALUES: dict[str, str] = {sid: meta["value"] for sid, meta in STORY_METADATA.items() if "value" in meta}
+STORY_METRICS: dict[str, str] = {sid: meta["metric"] for sid, meta in STORY_METADATA.items() if "metric" in meta}
+STORY_RESEARCH: dict[str, str] = {sid: meta["research"] for sid, meta in STORY_METADATA.items() if "research" in meta}
+STORY_KEY_FILES: dict[str, tuple[str, ...]] = {
+    sid: tuple(meta["key_files"]) for sid, meta in STORY_METADATA.items() if "key_files" in meta
+}
+STORY_DEPS: dict[str, tuple[str, ...]] = {sid: tuple(meta["deps"]) for sid, meta in STORY_METADATA.items() if "deps" in meta}
+
+def invalid_metadata_entries() -> list[str]:
+    """Describe STORY_METADATA entries with a non-numeric id or missing fields."""
+    problems = []
+    for sid, meta in STORY_METADATA.items():
+        if not sid.isdigit():
+            problems.append(f"{sid!r}: id is not a story number")
+        missing = [field for field in METADATA_FIELDS if field not in meta]
+        if missing:
+            problems.append(f"{sid!r}: missing {', '.join(missing)}")
+    return problems
+
+# Field patterns for the minimal story format, one search each: every pattern
+# opens with a literal, so sre's prefix scan skips straight to candidates
+# (a single alternation of all fields measured ~6x slower). DOTALL is scoped
+# to the multi-line story and AC sections; every other field is bounded to its
+# own line so malformed input cannot make a match run on across the file.
+# Patterns are bytes so a story is searched without decoding it first; only
+# the captures are decoded.
+TITLE_RE = re.compile(rb'^# AUTO-\d+: (.+)$', re.MULTILINE)
+META_RE = re.compile(
+    rb'\*\*Epic:\*\* ([^|\n]+)\|[ \t]*\*\*Points:\*\* (\d+)[ \t]*\|[ \t]*\*\*Priority:\*\* (P\d)[ \t]*\|[ \t]*\*\*Sprint:\*\* (\d+)'
+)
+STATUS_RE = re.compile(rb'\*\*Status:\*\* (.+)$', re.MULTILINE)
+COORDINATION_RES: tuple[tuple[str, re.Pattern[bytes]], ...] = (
+    ("worktree", re.compile(rb'\| Worktree \| `([^`\n]+)` \|')),
+    ("branch", re.compile(rb'\| Branch \| `([^`\n]+)` \|')),
+    ("depends_on", re.compile(rb'\| Depends On \| ([^|\n]+) \|')),
+    ("blocks", re.compile(rb'\| Blocks \| ([^|\n]+) \|')),
+    ("jira_key", re.compile(rb'\| JIRA Key \| ([^|\n]*) \|')),
+)
+STORY_TEXT_RE = re.compile(rb'## Story\n\n(.+?)\n\n---', re.DOTALL)
+# The first AC section (any heading level) runs up to the next \n---; its
+# lines are decoded and matched as str so \s and strip() keep their
+# Unicode meaning
+AC_SECTION_RE = re.compile(rb'## Acceptance Criteria\n\n(.+?)(?:\n---|\Z)', re.DOTALL)
+AC_LINE_RE = re.compile(r'-\s*\[\s*\]\s*(FUNC-\d+):\s*(.+)')
+
+# Full BMAD story layout, compiled into a renderer once at import. The tasks
+# table is identical for every story, so it is part of the template itself.
+STORY_TEMPLATE = """# {story_id}: {title}
+
+**Epic:** {epic} | **Points:** {points} | **Priority:** {priority} | **Sprint:** {sprint}
+**Status:** {status}
+
+---
+
+## Coordination
+
+| Field | Value |
+|-------|-------|
+| Worktree | `{worktree}` |
+| Branch | `{branch}` |
+| Depends On | {depends_on} |
+| Blocks | {blocks} |
+| JIRA Key | {jira_key} |
+
+### Task Execution Order
+
+```
+T1 -> T2 -> T3 -> T4
+```
+
+---
+
+## User Story
+
+{user_story}
+
+---
+
+## Business Value
+
+{business_value}
+
+---
+
+## Acceptance Criteria
+
+{acceptance_criteria}
+
+---
+
+## Tasks
+
+| Task | Description | Link | Status |
+|------|-------------|------|--------|
+| T1 | Core Implementation | [task-01-implementation.md](./tasks/task-01-implementation.md) | pending |
+| T2 | Unit Tests | [task-02-unit-tests.md](./tasks/task-02-unit-tests.md) | pending |
+| T3 | Integration Tests | [task-03-integration-tests.md](./tasks/task-03-integration-tests.md) | pending |
+| T4 | Documentation | [task-04-documentation.md](./tasks/task-04-documentation.md) | pending |
+
+---
+
+## Technical Notes
+
+{technical_notes}
+
+---
+
+## References
+
+- Epic: EPIC-4-AUTOMATION
+- PRD: .bmad/planning-artifacts/prd.md
+- Architecture: docs/ARCHITECTURE_OVERVIEW.md
+"""
+
+def extract_story_number(filepath: str) -> str:
+    """Extract story number from filepath like '01-remediationrequest-data-model'"""
+    dirname = os.path.basename(os.path.dirname(filepath))
+    number, sep, _ = dirname.partition('-')
+    if sep and number.isdecimal():
+        return number
+    return ""
+
+def parse_current_story(content: bytes) -> dict[str, Any]:
+    """Parse the current story format to extract key information."""
+    result: dict[str, Any] = {
+        "title": "",
+        "epic": "",
+        "points": "",
+        "priority": "",
+        "sprint": "",
+        "status": "",
+        "worktree": "",
+        "branch": "",
+        "depends_on": "",
+        "blocks": "",
+        "jira_key": "",
+        "story_text": "",
+        "acceptance_criteria": [],
+        "references": []
+    }
+
+    title_match = TITLE_RE.search(content)
+    if title_match:
+        result["title"] = title_match.group(1).decode("utf-8").strip()
+
+    meta_match = META_RE.search(content)
+    if meta_match:
+        result["epic"], result["points"], result["priority"], result["sprint"] = (
+            value.decode("utf-8").strip() for value in meta_match.groups()
+        )
+
+    status_match = STATUS_RE.search(content)
+    if status_match:
+        result["status"] = status_match.group(1).decode("utf-8").strip()
+
+    for field, pattern in COORDINATION_RES:
+        field_match = pattern.search(content)
+        if field_match:
+            result[field] = field_match.group(1).decode("utf-8").strip()
+
+    story_match = STORY_TEXT_RE.search(content)
+    if story_match:
+        result["story_text"] = story_match.group(1).decode("utf-8").strip()
+
+    # Only "- [ ] FUNC-1: ..." lines inside the first AC section count
+    ac_section = AC_SECTION_RE.search(content)
+    if ac_section:
+        for line in ac_section.group(1).decode("utf-8").strip().split("\n"):
+            ac_match = AC_LINE_RE.match(line)
+            if ac_match:
+                result["acceptance_criteria"].append({
+                    "id": ac_match.group(1),
+                    "text": ac_match.group(2).strip()
+                })
+
+    return result
+
+def generate_user_story(story_num: str, parsed: dict[str, Any]) -> str:
+    """Generate the user story section."""
+    action = STORY_ACTIONS.get(story_num, parsed["story_text"].lower())
+    benefit = STORY_BENEFITS.get(story_num, "the automation workflow is enhanced")
+
+    return f'As an **automation engineer**, I want **{action}**, so that **{benefit}**.'
+
+def generate_business_value(story_num: str, parsed: dict[str, Any]) -> str:
+    """Generate the business value section."""
+    value = STORY_VALUES.get(story_num, f"Enables {parsed['story_text'].lower()}")
+    metric = STORY_METRICS.get(story_num, "Feature functions as specified")
+    research = STORY_RESEARCH.get(story_num, "Automation requirements from security operations team")
+
+    return f"""**Value Statement:** {value}
+
+**Success Metric:** {metric}
+
+**User Research:** {research}"""
+
+def generate_acceptance_criteria(parsed: dict[str, Any]) -> str:
+    """Generate acceptance criteria in GIVEN/WHEN/THEN format."""
+    acs = parsed["acceptance_criteria"]
+    if not acs:
+        return """### AC1: Core Functionality
+**GIVEN** the system is properly configured
+**WHEN** the feature is invoked
+**THEN** the expected behavior occurs
+**AND** all validation passes"""
+
+    buf = io.StringIO()
+    for i, ac in enumerate(acs, 1):
+        if i > 1:
+            buf.write("\n\n")
+        ac_text = ac["text"]
+        # Generate GIVEN/WHEN/THEN based on AC text
+        buf.write(f"""### AC{i}: {ac_text}
+**GIVEN** the system is in a valid state
+**WHEN** {ac_text.lower()} is performed
+**THEN** the operation completes successfully
+**AND** the result is persisted and verifiable""")
+
+    return buf.getvalue()
+
+def generate_technical_notes(story_num: str) -> str:
+    """Generate technical notes section."""
+    key_files = STORY_KEY_FILES.get(story_num, ("TBD based on implementation",))
+    deps = STORY_DEPS.get(story_num, ("See Cargo.toml",))
+
+    key_files_str = "\n".join(f"- `{f}`" for f in key_files)
+    deps_str = ", ".join(deps)
+
+    return f"""### Key Files
+
+{key_files_str}
+
+### Dependencies
+
+{deps_str}
+
+### Testing Requirements
+
+| Path | Test File | Coverage |
+|------|-----------|----------|
+| Happy Path | tests/unit/{story_num}_test.rs | Core functionality |
+| Fail Path | tests/unit/{story_num}_errors_test.rs | Error handling |
+| Null/Empty | tests/unit/{story_num}_edge_test.rs | Edge cases |
+| Edge Cases | tests/integration/{story_num}_integration_test.rs | Integration scenarios |"""
+
+def compile_template(template: str) -> Callable[[dict[str, str]], str]:
+    """Specialize a str.format-style template into a renderer function.
+
+    The template is parsed once; the returned renderer interleaves its literal
+    chunks with the field values using itemgetter/zip/join, so rendering runs
+    without re-parsing the template or any per-field Python-level work. Only
+    plain {name} fields are supported, and there must be at least two of them
+    (itemgetter returns a bare value for one); anything else raises ValueError.
+    """
+    heads: list[str] = []
+    fields: list[str] = []
+    # Formatter.parse splits the literal text at {{ and }} escapes, so carry
+    # field-less chunks over into the next head (or the tail)
+    pending = ""
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        pending += literal
+        if field is None:
+            continue
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported format spec or conversion in template field {field!r}")
+        heads.append(pending)
+        fields.append(field)
+        pending = ""
+    if len(fields) < 2:
+        raise ValueError("Template must contain at least two fields")
+    tail = pending
+    get_fields = operator.itemgetter(*fields)
+
+    def render(values: dict[str, str]) -> str:
+        return "".join(chain.from_iterable(zip(heads, get_fields(values)))) + tail
+
+    return render
+
+render_story = compile_template(STORY_TEMPLATE)
+
+def content_digest(data: bytes) -> str:
+    """Return a short BLAKE2b hex digest of bytes-like data."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def remediate_story(filepath: str, story_num: str) -> tuple[str, str]:
+    """Remediate a single story file to BMAD-compliant format.
+
+    Returns the new content and the digest of the file it was built from.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    source_digest = content_digest(data)
+    if b"\r" in data:
+        # Translate newlines as a text-mode read would, so CRLF stories
+        # still match the \n-anchored patterns
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    parsed = parse_current_story(data)
+
+    new_content = render_story({
+        **parsed,
+        "story_id": f"AUTO-{story_num}",
+        "user_story": generate_user_story(story_num, parsed),
+        "business_value": generate_business_value(story_num, parsed),
+        "acceptance_criteria": generate_acceptance_criteria(parsed),
+        "technical_notes": generate_technical_notes(story_num),
+    })
+    return new_content, source_digest
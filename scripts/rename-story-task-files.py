@@ -12,9 +12,13 @@ Usage:
 
 import os
 import re
+import sys
 import argparse
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from dir_entries import sorted_entries
+
 
 def get_project_root() -> Path:
     return Path(__file__).parent.parent
@@ -27,47 +31,50 @@ def rename_files(epics_dir: Path, dry_run: bool = True):
     tasks_renamed = 0
 
     # Find all story directories
-    for epic_dir in sorted(epics_dir.iterdir()):
-        if not epic_dir.is_dir():
+    for epic_entry in sorted_entries(epics_dir):
+        if not epic_entry.is_dir():
             continue
 
-        stories_dir = epic_dir / "stories"
-        if not stories_dir.exists():
+        try:
+            story_entries = sorted_entries(os.path.join(epic_entry.path, "stories"))
+        except FileNotFoundError:
             continue
 
-        print(f"\n{epic_dir.name}")
+        print(f"\n{epic_entry.name}")
 
-        for story_dir in sorted(stories_dir.iterdir()):
-            if not story_dir.is_dir():
+        for story_entry in story_entries:
+            if not story_entry.is_dir():
                 continue
 
-            folder_name = story_dir.name  # e.g., "01-clickhouse-helm-chart-deployment"
+            folder_name = story_entry.name  # e.g., "01-clickhouse-helm-chart-deployment"
 
             # Rename README.md -> story-{folder-slug}.md
-            readme_file = story_dir / "README.md"
-            if readme_file.exists():
+            readme_file = os.path.join(story_entry.path, "README.md")
+            if os.path.exists(readme_file):
                 new_story_name = f"story-{folder_name}.md"
-                new_story_path = story_dir / new_story_name
 
                 print(f"  {folder_name}/README.md -> {new_story_name}")
 
                 if not dry_run:
-                    readme_file.rename(new_story_path)
+                    os.rename(readme_file, os.path.join(story_entry.path, new_story_name))
                 stories_renamed += 1
 
             # Rename task files: {NN}-{slug}.md -> task-{NN}-{slug}.md
-            tasks_dir = story_dir / "tasks"
-            if tasks_dir.exists():
-                for task_file in sorted(tasks_dir.glob("*.md")):
-                    if task_file.name.startswith("task-"):
-                        continue  # Already renamed
-
-                    new_task_name = f"task-{task_file.name}"
-                    new_task_path = tasks_dir / new_task_name
-
-                    if not dry_run:
-                        task_file.rename(new_task_path)
-                    tasks_renamed += 1
+            tasks_dir = os.path.join(story_entry.path, "tasks")
+            try:
+                task_entries = sorted_entries(tasks_dir)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            for task_entry in task_entries:
+                if not task_entry.name.endswith(".md"):
+                    continue
+                if task_entry.name.startswith("task-"):
+                    continue  # Already renamed
+
+                if not dry_run:
+                    os.rename(task_entry.path, os.path.join(tasks_dir, f"task-{task_entry.name}"))
+                tasks_renamed += 1
 
     return stories_renamed, tasks_renamed
 
@@ -15,112 +15,172 @@ Usage:
 
 import os
 import re
+import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+from atomic_write import write_file
+
 PROJECT_ROOT = Path(__file__).parent.parent
 INPUT_DIR = PROJECT_ROOT / ".bmad/generated-stories"
 OUTPUT_DIR = PROJECT_ROOT / ".bmad/jira-stories"
 
-
-def parse_verbose_story(filepath: Path) -> Optional[Dict]:
+CHUNK_SIZE = 8
+
+# Story parsing patterns, compiled once for all stories.
+# Section bodies are matched a line at a time up to the next \n## / \n---
+# style header rather than with a lazy DOTALL .+? (which retries the
+# lookahead at every character). Where the header must exist, the body is
+# wrapped as (?=(body))\1 so it is never backtracked into when none follows.
+YAML_BLOCK_RE = re.compile(r'```yaml\s*\n(story:.*?)```', re.DOTALL)
+TITLE_RE = re.compile(r'^# ([A-Z]+-\d+): (.+)$', re.MULTILINE)
+DESCRIPTION_RE = re.compile(r'## Problem Statement\s+(?=([^#\n`].[^\n]*(?:\n(?!##|---|```)[^\n]*)*))\1(?=\n(?:##|---|```))', re.DOTALL)
+SCOPE_RE = re.compile(r'### In Scope\s+(?=(.[^\n]*(?:\n(?!##|---)[^\n]*)*))\1(?=\n(?:##|---))', re.DOTALL)
+SCOPE_ITEM_RE = re.compile(r'^- (.+)$', re.MULTILINE)
+FR_RE = re.compile(r'### FR-(\d+): (.[^\n]*(?:\n(?!##|---)[^\n]*)*)', re.DOTALL)
+FR_TITLE_RE = re.compile(r'^(.+?)(?:\n|$)')
+GWT_SECTION_RE = re.compile(r'## Acceptance Criteria \(GIVEN-WHEN-THEN\)\s+(.[^\n]*(?:\n(?!---|## )[^\n]*)*)', re.DOTALL)
+GWT_BLOCK_RE = re.compile(r'### AC-(\d+): (.+?)```gherkin\s*\n(.+?)```', re.DOTALL)
+GWT_HEADER_RE = re.compile(r'### AC-\d+: ')
+THEN_RE = re.compile(r'THEN (.+?)(?=\n|$)')
+AC_SECTION_RE = re.compile(r'## Acceptance Criteria\s+(?=(.[^\n]*(?:\n(?!---|##)[^\n]*)*))\1(?=\n(?:---|##))', re.DOTALL)
+AC_CHECKBOX_RE = re.compile(r'- \[[ x]\] (.+?)$', re.MULTILINE)
+FILES_RE = re.compile(r'## Target Files\s+```\s*\n(.+?)```', re.DOTALL)
+FILE_LINE_RE = re.compile(r'^\s*(\S+\.\w+)\s', re.MULTILINE)
+
+# The libyaml-backed loader is ~10x faster; PyYAML only defines it when
+# built with libyaml, so fall back to the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(slots=True)
+class Story:
+    """Fields pulled from a verbose story for the simplified format."""
+    file: str
+    id: str = ""
+    title: str = ""
+    epic: str = ""
+    priority: str = "P2"
+    points: int = 0
+    sprint: int = 1
+    description: str = ""
+    acceptance_criteria: List[str] = field(default_factory=list)
+    functional_requirements: List[Dict] = field(default_factory=list)
+    in_scope: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+
+
+def find_gwt_blocks(section: str) -> List[tuple]:
+    """Return GWT_BLOCK_RE.findall(section) in linear time.
+
+    findall retries the lazy title from every "### AC-" header, and each
+    retry scans to the end of the section when no gherkin block follows,
+    which is quadratic in the number of headers. Once a well-formed header
+    fails to match, no later header can match either (an earlier title
+    could always stretch to the same block), so we stop there.
+    """
+    blocks = []
+    pos = section.find("### AC-")
+    while pos != -1:
+        match = GWT_BLOCK_RE.match(section, pos)
+        if match:
+            blocks.append(match.groups())
+            pos = section.find("### AC-", match.end())
+        elif GWT_HEADER_RE.match(section, pos):
+            break
+        else:
+            pos = section.find("### AC-", pos + 1)
+    return blocks
+
+
+def parse_verbose_story(filepath: Path) -> Optional[Story]:
     """Parse a verbose story file and extract key information."""
-    content = filepath.read_text()
-
-    story = {
-        "file": filepath.name,
-        "id": "",
-        "title": "",
-        "epic": "",
-        "priority": "P2",
-        "points": 0,
-        "sprint": 1,
-        "description": "",
-        "acceptance_criteria": [],
-        "functional_requirements": [],
-        "in_scope": [],
-        "files": []
-    }
+    content = filepath.read_text(encoding="utf-8")
+
+    story = Story(file=filepath.name)
 
     # Extract YAML metadata
-    yaml_match = re.search(r'```yaml\s*\n(story:.*?)```', content, re.DOTALL)
+    yaml_match = YAML_BLOCK_RE.search(content)
     if yaml_match:
         try:
-            metadata = yaml.safe_load(yaml_match.group(1))
+            metadata = yaml.load(yaml_match.group(1), Loader=YAML_LOADER)
             if "story" in metadata:
-                story["id"] = metadata["story"].get("id", "")
-                story["title"] = metadata["story"].get("title", "").strip('"')
+                story.id = metadata["story"].get("id", "")
+                story.title = metadata["story"].get("title", "").strip('"')
             if "metadata" in metadata:
                 meta = metadata["metadata"]
-                story["epic"] = meta.get("parent", "")
-                story["priority"] = meta.get("priority", "P2")
-                story["points"] = meta.get("points", 0)
-                story["sprint"] = meta.get("sprint", 1)
+                story.epic = meta.get("parent", "")
+                story.priority = meta.get("priority", "P2")
+                story.points = meta.get("points", 0)
+                story.sprint = meta.get("sprint", 1)
         except yaml.YAMLError:
             pass
 
     # Extract title from header if not in YAML
-    if not story["id"]:
-        title_match = re.search(r'^# ([A-Z]+-\d+): (.+)$', content, re.MULTILINE)
+    if not story.id:
+        title_match = TITLE_RE.search(content)
         if title_match:
-            story["id"] = title_match.group(1)
-            story["title"] = title_match.group(2).strip()
+            story.id = title_match.group(1)
+            story.title = title_match.group(2).strip()
 
     # Extract description (Problem Statement or first paragraph)
-    desc_match = re.search(r'## Problem Statement\s+([^#\n`].+?)(?=\n###|\n---|\n##|\n```)', content, re.DOTALL)
+    desc_match = DESCRIPTION_RE.search(content)
     if desc_match:
-        story["description"] = desc_match.group(1).strip()[:300]
+        story.description = desc_match.group(1).strip()[:300]
 
     # Extract In Scope items
-    scope_match = re.search(r'### In Scope\s+(.+?)(?=\n###|\n---|\n##)', content, re.DOTALL)
+    scope_match = SCOPE_RE.search(content)
     if scope_match:
-        scope_items = re.findall(r'^- (.+)$', scope_match.group(1), re.MULTILINE)
-        story["in_scope"] = [item.strip() for item in scope_items[:10]]
+        scope_items = SCOPE_ITEM_RE.findall(scope_match.group(1))
+        story.in_scope = [item.strip() for item in scope_items[:10]]
 
     # Extract Functional Requirements
-    fr_matches = re.findall(r'### FR-(\d+): (.+?)(?=\n###|\n---|\n##|\Z)', content, re.DOTALL)
+    fr_matches = FR_RE.findall(content)
     for fr_num, fr_content in fr_matches:
-        fr_title_match = re.search(r'^(.+?)(?:\n|$)', fr_content.strip())
+        fr_title_match = FR_TITLE_RE.search(fr_content.strip())
         if fr_title_match:
-            story["functional_requirements"].append({
+            story.functional_requirements.append({
                 "id": f"FR-{fr_num}",
                 "title": fr_title_match.group(1).strip()[:100]
             })
 
     # Extract GIVEN-WHEN-THEN acceptance criteria
-    ac_section = re.search(r'## Acceptance Criteria \(GIVEN-WHEN-THEN\)\s+(.+?)(?=\n---|\n## |\Z)', content, re.DOTALL)
+    ac_section = GWT_SECTION_RE.search(content)
     if ac_section:
-        ac_blocks = re.findall(r'### AC-(\d+): (.+?)```gherkin\s*\n(.+?)```', ac_section.group(1), re.DOTALL)
+        ac_blocks = find_gwt_blocks(ac_section.group(1))
         for ac_num, ac_title, gherkin in ac_blocks:
             # Extract THEN clauses as acceptance criteria
-            then_matches = re.findall(r'THEN (.+?)(?=\n|$)', gherkin)
+            then_matches = THEN_RE.findall(gherkin)
             for then_clause in then_matches:
-                story["acceptance_criteria"].append(then_clause.strip()[:150])
+                story.acceptance_criteria.append(then_clause.strip()[:150])
 
     # Fallback: extract any checkbox acceptance criteria
-    if not story["acceptance_criteria"]:
-        ac_match = re.search(r'## Acceptance Criteria\s+(.+?)(?=\n---|\n##)', content, re.DOTALL)
+    if not story.acceptance_criteria:
+        ac_match = AC_SECTION_RE.search(content)
         if ac_match:
-            criteria = re.findall(r'- \[[ x]\] (.+?)$', ac_match.group(1), re.MULTILINE)
-            story["acceptance_criteria"] = [c.strip()[:150] for c in criteria[:10]]
+            criteria = AC_CHECKBOX_RE.findall(ac_match.group(1))
+            story.acceptance_criteria = [c.strip()[:150] for c in criteria[:10]]
 
     # Extract target files
-    files_match = re.search(r'## Target Files\s+```\s*\n(.+?)```', content, re.DOTALL)
+    files_match = FILES_RE.search(content)
     if files_match:
-        file_lines = re.findall(r'^\s*(\S+\.\w+)\s', files_match.group(1), re.MULTILINE)
-        story["files"] = file_lines[:10]
+        file_lines = FILE_LINE_RE.findall(files_match.group(1))
+        story.files = file_lines[:10]
 
-    return story if story["id"] else None
+    return story if story.id else None
 
 
-def generate_tasks_from_story(story: Dict) -> List[Dict]:
+def generate_tasks_from_story(story: Story) -> List[Dict]:
     """Generate tasks and subtasks from story content."""
     tasks = []
 
     # Strategy 1: Use Functional Requirements as tasks
-    if story["functional_requirements"]:
-        for i, fr in enumerate(story["functional_requirements"], 1):
+    if story.functional_requirements:
+        for i, fr in enumerate(story.functional_requirements, 1):
             task = {
                 "id": f"T{i}",
                 "title": fr["title"],
@@ -133,8 +193,8 @@ def generate_tasks_from_story(story: Dict) -> List[Dict]:
             tasks.append(task)
 
     # Strategy 2: Use In Scope items as tasks
-    elif story["in_scope"]:
-        for i, scope in enumerate(story["in_scope"], 1):
+    elif story.in_scope:
+        for i, scope in enumerate(story.in_scope, 1):
             task = {
                 "id": f"T{i}",
                 "title": scope[:80],
@@ -148,7 +208,7 @@ def generate_tasks_from_story(story: Dict) -> List[Dict]:
     # Strategy 3: Generate generic tasks from acceptance criteria
     else:
         # Group acceptance criteria into tasks
-        for i, ac in enumerate(story["acceptance_criteria"][:5], 1):
+        for i, ac in enumerate(story.acceptance_criteria[:5], 1):
             task = {
                 "id": f"T{i}",
                 "title": f"Implement: {ac[:60]}",
@@ -174,49 +234,76 @@ def generate_tasks_from_story(story: Dict) -> List[Dict]:
     return tasks
 
 
-def generate_simplified_story(story: Dict) -> str:
+def generate_simplified_story(story: Story) -> str:
     """Generate simplified markdown for JIRA sync."""
     tasks = generate_tasks_from_story(story)
 
     # Calculate task points distribution
-    total_points = story["points"] or 1
+    total_points = story.points or 1
     points_per_task = round(total_points / max(len(tasks), 1), 1)
 
     lines = [
-        f"# {story['id']}: {story['title']}",
+        f"# {story.id}: {story.title}",
         "",
-        f"**Epic:** {story['epic']} | **Points:** {story['points']} | **Priority:** {story['priority']} | **Sprint:** {story['sprint']}",
+        f"**Epic:** {story.epic} | **Points:** {story.points} | **Priority:** {story.priority} | **Sprint:** {story.sprint}",
         "",
         "## Description",
-        story["description"] or "No description available.",
+        story.description or "No description available.",
         "",
         "## Acceptance Criteria",
     ]
 
-    for ac in story["acceptance_criteria"][:8]:
+    for ac in story.acceptance_criteria[:8]:
         lines.append(f"- [ ] {ac}")
 
-    if not story["acceptance_criteria"]:
+    if not story.acceptance_criteria:
         lines.append("- [ ] All functional requirements implemented")
         lines.append("- [ ] Tests passing")
 
     lines.extend(["", "## Tasks", ""])
 
+    # Every task carries the same points suffix; formatting the float once
+    # is most of the per-task cost
+    pts_suffix = f" ({points_per_task} pts)"
     for task in tasks:
-        lines.append(f"### {task['id']}: {task['title']} ({points_per_task} pts)")
+        lines.append(f"### {task['id']}: {task['title']}{pts_suffix}")
         for st in task["subtasks"]:
             lines.append(f"- [ ] {st['id']}: {st['title']}")
         lines.append("")
 
-    if story["files"]:
+    if story.files:
         lines.extend(["## Files"])
-        for f in story["files"][:8]:
+        for f in story.files[:8]:
             lines.append(f"- `{f}`")
 
     return "\n".join(lines)
 
 
-def process_epic_directory(epic_dir: Path, output_dir: Path, dry_run: bool = False) -> Dict:
+def simplify_story(job: tuple) -> tuple:
+    """Simplify one story file, writing the result unless this is a dry run.
+
+    Returns ("processed", progress line), ("skipped", None) or
+    ("error", "name: message") so the caller can report in file order.
+    """
+    story_file, output_file, dry_run = job
+    try:
+        story = parse_verbose_story(story_file)
+        if not story:
+            return "skipped", None
+
+        simplified = generate_simplified_story(story)
+
+        if dry_run:
+            return "processed", f"    [DRY] {story_file.name}: {len(simplified.splitlines())} lines"
+        write_file(str(output_file), simplified.encode("utf-8"))
+        return "processed", f"    ✓ {story_file.name}: {len(simplified.splitlines())} lines"
+
+    except Exception as e:
+        return "error", f"{story_file.name}: {e}"
+
+
+def process_epic_directory(epic_dir: Path, output_dir: Path, executor: ProcessPoolExecutor,
+                           dry_run: bool = False) -> Dict:
     """Process all stories in an epic directory."""
     results = {"processed": 0, "skipped": 0, "errors": []}
 
@@ -226,34 +313,28 @@ def process_epic_directory(epic_dir: Path, output_dir: Path, dry_run: bool = Fal
     if not dry_run:
         output_epic_dir.mkdir(parents=True, exist_ok=True)
 
-    story_files = sorted(epic_dir.glob("*.md"))
+    # Same entries as glob("*.md"), without a second pass over the names
+    with os.scandir(epic_dir) as entries:
+        story_files = sorted(Path(entry.path) for entry in entries if entry.name.endswith(".md"))
     print(f"\n  Processing {epic_name}: {len(story_files)} stories")
 
-    for story_file in story_files:
-        if story_file.name == "README.md":
-            continue
-
-        try:
-            story = parse_verbose_story(story_file)
-            if not story:
-                results["skipped"] += 1
-                continue
-
-            simplified = generate_simplified_story(story)
-            output_file = output_epic_dir / story_file.name
-
-            if dry_run:
-                print(f"    [DRY] {story_file.name}: {len(simplified.splitlines())} lines")
-            else:
-                output_file.write_text(simplified)
-                print(f"    ✓ {story_file.name}: {len(simplified.splitlines())} lines")
+    jobs = [
+        (story_file, output_epic_dir / story_file.name, dry_run)
+        for story_file in story_files
+        if story_file.name != "README.md"
+    ]
 
+    # Stories are independent; map keeps the progress lines in file order
+    for status, message in executor.map(simplify_story, jobs, chunksize=CHUNK_SIZE):
+        if status == "skipped":
+            results["skipped"] += 1
+        elif status == "error":
+            results["errors"].append(message)
+            print(f"    ✗ {message}")
+        else:
+            print(message)
             results["processed"] += 1
 
-        except Exception as e:
-            results["errors"].append(f"{story_file.name}: {e}")
-            print(f"    ✗ {story_file.name}: {e}")
-
     return results
 
 
@@ -297,16 +378,18 @@ def main():
 
     total = {"processed": 0, "skipped": 0, "errors": []}
 
-    epic_dirs = sorted([d for d in INPUT_DIR.iterdir() if d.is_dir()])
+    with os.scandir(INPUT_DIR) as entries:
+        epic_dirs = sorted(Path(entry.path) for entry in entries if entry.is_dir())
 
-    for epic_dir in epic_dirs:
-        if args.epic and args.epic not in epic_dir.name:
-            continue
+    with ProcessPoolExecutor() as executor:
+        for epic_dir in epic_dirs:
+            if args.epic and args.epic not in epic_dir.name:
+                continue
 
-        results = process_epic_directory(epic_dir, OUTPUT_DIR, args.dry_run)
-        total["processed"] += results["processed"]
-        total["skipped"] += results["skipped"]
-        total["errors"].extend(results["errors"])
+            results = process_epic_directory(epic_dir, OUTPUT_DIR, executor, args.dry_run)
+            total["processed"] += results["processed"]
+            total["skipped"] += results["skipped"]
+            total["errors"].extend(results["errors"])
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -15,72 +15,116 @@ from pathlib import Path
 
 EPICS_DIR = Path(__file__).parent.parent / ".bmad/planning-artifacts/epics"
 
+# Stories listed in the summary table; the rest are only counted
+SUMMARY_STORY_LIMIT = 100
+
+# Epic parsing patterns, compiled once for all epic files. Section bodies
+# are matched a line at a time up to the next \n## / \n--- header; the
+# (?=(body))\1 wrapper stops the engine backtracking into a body when no
+# closing header follows it.
+TITLE_RE = re.compile(r'^# (EPIC-[\w-]+): (.+)$', re.MULTILINE)
+METADATA_FIELD_RES = tuple(
+    (field.lower().replace(' ', '_'), re.compile(rf'\*\*{field}:\*\* (.+)$', re.MULTILINE))
+    for field in ['Status', 'Team', 'MVP Scope', 'Priority']
+)
+TOTAL_STORIES_RE = re.compile(r'\*\*Total Stories:\*\* (\d+)')
+TOTAL_POINTS_RE = re.compile(r'\*\*Total Points:\*\* (\d+)')
+SUMMARY_RE = re.compile(r'## Summary\s+(?=(.[^\n]*(?:\n(?!---|## )[^\n]*)*))\1(?=\n(?:---|## ))', re.DOTALL)
+BUSINESS_VALUE_RE = re.compile(r'## Business Value\s+(?=(.[^\n]*(?:\n(?!---|## )[^\n]*)*))\1(?=\n(?:---|## ))', re.DOTALL)
+EPIC_AC_RE = re.compile(r'## (?:Epic )?Acceptance Criteria\s+(?=(.[^\n]*(?:\n(?!---|## )[^\n]*)*))\1(?=\n(?:---|## ))', re.DOTALL)
+# No leading ^ so sre can use its literal-prefix scan; callers check that
+# the match starts a line
+STORY_HEADER_RE = re.compile(r'#### ([A-Z]+-\d+): (.+)$', re.MULTILINE)
+STORY_POINTS_RE = re.compile(r'\*\*Points:\*\* (\d+)')
+STORY_SPRINT_RE = re.compile(r'\*\*Sprint:\*\* (\d+)')
+# Characters after a story header searched for its points and sprint
+STORY_WINDOW = 500
+
 
 def extract_epic_metadata(content: str) -> dict:
     """Extract key metadata from epic file."""
     metadata = {}
 
     # Title
-    title_match = re.search(r'^# (EPIC-[\w-]+): (.+)$', content, re.MULTILINE)
+    title_match = TITLE_RE.search(content)
     if title_match:
         metadata['id'] = title_match.group(1)
         metadata['title'] = title_match.group(2)
 
     # Status, Priority, Team, etc.
-    for field in ['Status', 'Team', 'MVP Scope', 'Priority']:
-        match = re.search(rf'\*\*{field}:\*\* (.+)$', content, re.MULTILINE)
+    for key, field_re in METADATA_FIELD_RES:
+        match = field_re.search(content)
         if match:
-            metadata[field.lower().replace(' ', '_')] = match.group(1).strip()
+            metadata[key] = match.group(1).strip()
 
     # Total Stories and Points
-    stories_match = re.search(r'\*\*Total Stories:\*\* (\d+)', content)
-    points_match = re.search(r'\*\*Total Points:\*\* (\d+)', content)
+    stories_match = TOTAL_STORIES_RE.search(content)
+    points_match = TOTAL_POINTS_RE.search(content)
     if stories_match:
         metadata['total_stories'] = stories_match.group(1)
     if points_match:
         metadata['total_points'] = points_match.group(1)
 
     # Summary section
-    summary_match = re.search(r'## Summary\s+(.+?)(?=\n---|\n## )', content, re.DOTALL)
+    summary_match = SUMMARY_RE.search(content)
     if summary_match:
         metadata['summary'] = summary_match.group(1).strip()[:500]
 
     # Business Value
-    bv_match = re.search(r'## Business Value\s+(.+?)(?=\n---|\n## )', content, re.DOTALL)
+    bv_match = BUSINESS_VALUE_RE.search(content)
     if bv_match:
         metadata['business_value'] = bv_match.group(1).strip()
 
     # Acceptance Criteria
-    ac_match = re.search(r'## (?:Epic )?Acceptance Criteria\s+(.+?)(?=\n---|\n## )', content, re.DOTALL)
+    ac_match = EPIC_AC_RE.search(content)
     if ac_match:
         metadata['acceptance_criteria'] = ac_match.group(1).strip()
 
     return metadata
 
 
-def extract_stories(content: str) -> list:
-    """Extract story IDs and titles."""
+def find_story_field(content: str, story_id: str, start: int, field_re) -> str:
+    """Find field_re after story_id on the same line, within the story window.
+
+    Only the rest of each line holding story_id is searched, so a field
+    that follows the id on a later line is not picked up.
+    """
+    end = start + STORY_WINDOW
+    pos = content.find(story_id, start, end)
+    while pos != -1:
+        pos += len(story_id)
+        line_end = content.find('\n', pos, end)
+        if line_end == -1:
+            line_end = end
+        match = field_re.search(content, pos, line_end)
+        if match:
+            return match.group(1)
+        pos = content.find(story_id, line_end, end)
+    return '?'
+
+
+def extract_stories(content: str, limit: int = None) -> tuple:
+    """Extract story IDs and titles.
+
+    Returns the first `limit` stories (all if None) and the total count.
+    """
     stories = []
+    total = 0
 
-    # Pattern for story headers: #### STORY-ID: Title
-    pattern = r'^#### ([A-Z]+-\d+): (.+)$'
-    for match in re.finditer(pattern, content, re.MULTILINE):
+    # Story headers: #### STORY-ID: Title, at the start of a line
+    for match in STORY_HEADER_RE.finditer(content):
+        if match.start() and content[match.start() - 1] != '\n':
+            continue
+        total += 1
+        # Past the limit only the count is needed, not points or sprint
+        if limit is not None and total > limit:
+            continue
         story_id = match.group(1)
         title = match.group(2).strip()
 
-        # Try to extract points
-        points_match = re.search(
-            rf'{re.escape(story_id)}.*?\*\*Points:\*\* (\d+)',
-            content[match.start():match.start()+500]
-        )
-        points = points_match.group(1) if points_match else '?'
-
-        # Try to extract sprint
-        sprint_match = re.search(
-            rf'{re.escape(story_id)}.*?\*\*Sprint:\*\* (\d+)',
-            content[match.start():match.start()+500]
-        )
-        sprint = sprint_match.group(1) if sprint_match else '?'
+        # Try to extract points and sprint
+        points = find_story_field(content, story_id, match.start(), STORY_POINTS_RE)
+        sprint = find_story_field(content, story_id, match.start(), STORY_SPRINT_RE)
 
         stories.append({
             'id': story_id,
@@ -89,10 +133,10 @@ def extract_stories(content: str) -> list:
             'sprint': sprint
         })
 
-    return stories
+    return stories, total
 
 
-def generate_summary(metadata: dict, stories: list) -> str:
+def generate_summary(metadata: dict, stories: list, total_stories: int) -> str:
     """Generate the summary file content."""
     lines = [
         f"# {metadata.get('id', 'EPIC-?')}: {metadata.get('title', 'Unknown')}",
@@ -101,7 +145,7 @@ def generate_summary(metadata: dict, stories: list) -> str:
         f"**Priority:** {metadata.get('priority', 'P1')}",
         f"**Owner:** {metadata.get('team', 'TBD')}",
         f"**MVP:** {metadata.get('mvp_scope', 'MVP 1')}",
-        f"**Total Stories:** {metadata.get('total_stories', len(stories))} | **Total Points:** {metadata.get('total_points', '?')}",
+        f"**Total Stories:** {metadata.get('total_stories', total_stories)} | **Total Points:** {metadata.get('total_points', '?')}",
         "",
         "---",
         "",
@@ -129,11 +173,11 @@ def generate_summary(metadata: dict, stories: list) -> str:
         "|----|-------|-----|--------|--------|",
     ]
 
-    for story in stories[:100]:  # Limit to 100 stories in summary
+    for story in stories[:SUMMARY_STORY_LIMIT]:
         lines.append(f"| {story['id']} | {story['title']} | {story['points']} | {story['sprint']} | backlog |")
 
-    if len(stories) > 100:
-        lines.append(f"| ... | ({len(stories) - 100} more stories) | ... | ... | ... |")
+    if total_stories > SUMMARY_STORY_LIMIT:
+        lines.append(f"| ... | ({total_stories - SUMMARY_STORY_LIMIT} more stories) | ... | ... | ... |")
 
     lines.extend([
         "",
@@ -155,17 +199,17 @@ def process_epic(filepath: Path, dry_run: bool = False) -> bool:
 
     # Extract metadata and stories
     metadata = extract_epic_metadata(content)
-    stories = extract_stories(content)
+    stories, total_stories = extract_stories(content, SUMMARY_STORY_LIMIT)
 
     if not metadata.get('id'):
         print(f"  ⚠ Could not extract epic ID from {filepath.name}")
         return False
 
     print(f"  Processing {filepath.name}")
-    print(f"    ID: {metadata.get('id')}, Stories: {len(stories)}")
+    print(f"    ID: {metadata.get('id')}, Stories: {total_stories}")
 
     # Generate summary
-    summary = generate_summary(metadata, stories)
+    summary = generate_summary(metadata, stories, total_stories)
 
     # File paths
     summary_path = filepath.parent / f"{metadata['id']}-summary.md"
@@ -210,10 +254,12 @@ def main():
         files = [EPICS_DIR / args.epic]
     else:
         # Get all epic files that haven't been split yet
-        files = sorted([
-            f for f in EPICS_DIR.glob("EPIC-*.md")
-            if '-summary' not in f.name and '-full' not in f.name
-        ])
+        with os.scandir(EPICS_DIR) as entries:
+            files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.startswith("EPIC-") and entry.name.endswith(".md")
+                and '-summary' not in entry.name and '-full' not in entry.name
+            )
 
     for filepath in files:
         if not filepath.exists():
@@ -0,0 +1,86 @@
+"""Tests for the EPIC-4 story parser in remediate_epic4_core."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from remediate_epic4_core import compile_template, parse_current_story, remediate_story
+
+
+class ParseAcceptanceCriteriaTest(unittest.TestCase):
+    def test_h2_heading(self):
+        parsed = parse_current_story(
+            b"## Acceptance Criteria\n\n- [ ] FUNC-1: Create key\n- [ ] FUNC-2: Rotate key\n\n---\n"
+        )
+        self.assertEqual(parsed["acceptance_criteria"], [
+            {"id": "FUNC-1", "text": "Create key"},
+            {"id": "FUNC-2", "text": "Rotate key"},
+        ])
+
+    def test_h3_heading(self):
+        parsed = parse_current_story(
+            b"## Story\n\nText\n\n---\n\n### Acceptance Criteria\n\n- [ ] FUNC-1: Create key\n\n---\n"
+        )
+        self.assertEqual(parsed["acceptance_criteria"], [{"id": "FUNC-1", "text": "Create key"}])
+
+    def test_section_runs_to_end_of_file(self):
+        parsed = parse_current_story(b"## Acceptance Criteria\n\n  - [ ] FUNC-7: Last one  ")
+        self.assertEqual(parsed["acceptance_criteria"], [{"id": "FUNC-7", "text": "Last one"}])
+
+    def test_rule_right_after_heading_is_part_of_section(self):
+        parsed = parse_current_story(b"## Acceptance Criteria\n\n----\n- [ ] FUNC-1: Create key\n---\n")
+        self.assertEqual(parsed["acceptance_criteria"], [{"id": "FUNC-1", "text": "Create key"}])
+
+    def test_only_first_section_counts(self):
+        parsed = parse_current_story(
+            b"## Acceptance Criteria\n\nTBD\n---\n## Acceptance Criteria\n\n- [ ] FUNC-1: Later\n"
+        )
+        self.assertEqual(parsed["acceptance_criteria"], [])
+
+
+class CompileTemplateTest(unittest.TestCase):
+    def assertRendersLikeFormat(self, template, **values):
+        self.assertEqual(compile_template(template)(values), template.format(**values))
+
+    def test_plain_fields(self):
+        self.assertRendersLikeFormat("# {x}\n\n{y} tail", x="X", y="Y")
+
+    def test_escaped_braces(self):
+        self.assertRendersLikeFormat("a{{b}} {x} c {y}", x="X", y="Y")
+        self.assertRendersLikeFormat("{x}{y} tail {{z}}", x="X", y="Y")
+
+    def test_rejects_format_spec(self):
+        with self.assertRaises(ValueError):
+            compile_template("{x:>5}{y}")
+
+    def test_rejects_single_field(self):
+        with self.assertRaises(ValueError):
+            compile_template("only {x}")
+
+
+class RemediateStoryTest(unittest.TestCase):
+    STORY = (
+        b"# AUTO-01: Data model\n\n"
+        b"**Epic:** EPIC-4 | **Points:** 5 | **Priority:** P1 | **Sprint:** 3\n\n"
+        b"## Story\n\nStore requests\n\n---\n\n"
+        b"## Acceptance Criteria\n\n- [ ] FUNC-1: Create key\n\n---\n"
+    )
+
+    def remediate(self, data):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "story.md")
+            with open(path, "wb") as f:
+                f.write(data)
+            return remediate_story(path, "01")[0]
+
+    def test_crlf_story_parses_like_lf(self):
+        lf = self.remediate(self.STORY)
+        self.assertIn("### AC1: Create key", lf)
+        self.assertEqual(self.remediate(self.STORY.replace(b"\n", b"\r\n")), lf)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,62 +11,95 @@ To:
 And adds JIRA sync comments.
 """
 
+import hashlib
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from file_cache import load_cache, save_cache
+
 IMPL_DIR = Path(__file__).parent.parent / ".bmad/implementation-artifacts"
 
+CHUNK_SIZE = 8
+
+# Per-file (mtime_ns, size, progress lines) for files that needed no
+# changes last run, so re-runs only stat them instead of re-parsing
+CACHE_FILE = Path(__file__).parent / ".update-impl-artifacts-cache.json"
+
+# Story header formats: "# Story AUTH-001.2:" and "# Story auth-001-2:"
+STORY_ID_RE = re.compile(r'^# Story ([A-Z]+-\d+\.\d+[a-z]?):', re.MULTILINE)
+AUTH_STORY_ID_RE = re.compile(r'^# Story (auth-\d+-\d+[a-z]?):', re.MULTILINE | re.IGNORECASE)
+
+# Task rewrite patterns, compiled once for all files
+TASKS_HEADER_RE = re.compile(r'^## Tasks\s*\n', re.MULTILINE)
+# Match: ### Task N: Title (AC: X, Y) or ### Task N: Title
+TASK_HEADER_RE = re.compile(r'^### Task (\d+): ([^\n]+?)(?:\s*\(AC:\s*([^)]+)\))?\s*$', re.MULTILINE)
+AC_NUM_RE = re.compile(r'\d+')
+# Match: | N.M | rest of row
+SUBTASK_ROW_RE = re.compile(r'^\| (\d+)\.(\d+) \|(.+)$', re.MULTILINE)
+# Tasks header, task header and subtask row alternatives in one pattern, so
+# process_file rewrites a file in a single scan instead of one per pattern
+TASK_REWRITE_RE = re.compile(
+    r'^(?:(## Tasks\s*\n)'
+    r'|### Task (\d+): ([^\n]+?)(?:\s*\(AC:\s*([^)]+)\))?\s*$'
+    r'|\| (\d+)\.(\d+) \|(.+)$)',
+    re.MULTILINE,
+)
+
+JIRA_SYNC_COMMENT = """## Tasks
+
+<!-- JIRA SYNC: Each ### becomes a JIRA Task, each table row becomes a Sub-task -->
+<!-- Task naming: {story_id}-T1, {story_id}-T2, etc. -->
+"""
+
 
 def extract_story_id(content: str) -> str:
     """Extract story ID from file content."""
     # Try format: # Story AUTH-001.2: Title
-    match = re.search(r'^# Story ([A-Z]+-\d+\.\d+[a-z]?):', content, re.MULTILINE)
+    match = STORY_ID_RE.search(content)
     if match:
         return match.group(1).replace('.', '-')
 
     # Try format: # Story auth-001.2: or auth-001-2:
-    match = re.search(r'^# Story (auth-\d+-\d+[a-z]?):', content, re.MULTILINE | re.IGNORECASE)
+    match = AUTH_STORY_ID_RE.search(content)
     if match:
         return match.group(1).upper().replace('.', '-')
 
     return None
 
 
+def format_task_header(story_id: str, task_num: str, title: str, ac_ref: str) -> str:
+    """Build the JIRA-sync header (and Linked to line) for one task."""
+    new_header = f"### {story_id}-T{task_num}: {title.strip()}"
+    if ac_ref:
+        # Extract AC numbers
+        ac_nums = AC_NUM_RE.findall(ac_ref)
+        ac_list = ", ".join([f"AC-{n}" for n in ac_nums])
+        new_header += f"\n**Linked to:** {ac_list}"
+
+    return new_header
+
+
 def update_tasks_section(content: str, story_id: str) -> str:
     """Update Tasks section to JIRA-sync compatible format."""
 
     # Check if already has JIRA SYNC comment
     if "<!-- JIRA SYNC:" in content:
-        print(f"    Already has JIRA SYNC format")
         return content
 
     # Add JIRA sync comment after ## Tasks header
-    jira_comment = """## Tasks
-
-<!-- JIRA SYNC: Each ### becomes a JIRA Task, each table row becomes a Sub-task -->
-<!-- Task naming: {story_id}-T1, {story_id}-T2, etc. -->
-""".format(story_id=story_id)
+    jira_comment = JIRA_SYNC_COMMENT.format(story_id=story_id)
 
-    content = re.sub(r'^## Tasks\s*\n', jira_comment, content, flags=re.MULTILINE)
+    content = TASKS_HEADER_RE.sub(jira_comment, content)
 
     # Transform task headers: ### Task N: Title (AC: X) → ### STORY-ID-TN: Title
     def transform_task(match):
-        task_num = match.group(1)
-        title = match.group(2).strip()
-        ac_ref = match.group(3) if match.group(3) else ""
-
-        new_header = f"### {story_id}-T{task_num}: {title}"
-        if ac_ref:
-            # Extract AC numbers
-            ac_nums = re.findall(r'\d+', ac_ref)
-            ac_list = ", ".join([f"AC-{n}" for n in ac_nums])
-            new_header += f"\n**Linked to:** {ac_list}"
-
-        return new_header
+        return format_task_header(story_id, match.group(1), match.group(2), match.group(3))
 
-    # Match: ### Task N: Title (AC: X, Y) or ### Task N: Title
-    pattern = r'^### Task (\d+): ([^\n]+?)(?:\s*\(AC:\s*([^)]+)\))?\s*$'
-    content = re.sub(pattern, transform_task, content, flags=re.MULTILINE)
+    content = TASK_HEADER_RE.sub(transform_task, content)
 
     return content
 
@@ -83,52 +116,86 @@ def update_subtask_ids(content: str, story_id: str) -> str:
         new_id = f"T{task_num}-S{subtask_num}"
         return f"| {new_id} |{rest}"
 
-    # Match: | N.M | rest of row
-    pattern = r'^\| (\d+)\.(\d+) \|(.+)$'
-    content = re.sub(pattern, transform_subtask_row, content, flags=re.MULTILINE)
+    content = SUBTASK_ROW_RE.sub(transform_subtask_row, content)
 
     return content
 
 
-def process_file(filepath: Path, dry_run: bool = False) -> bool:
-    """Process a single story file."""
+def update_task_ids(content: str, story_id: str) -> str:
+    """Apply update_tasks_section then update_subtask_ids in a single pass."""
+    if "<!-- JIRA SYNC:" in content:
+        return update_subtask_ids(content, story_id)
+
+    jira_comment = JIRA_SYNC_COMMENT.format(story_id=story_id)
+    spans_tasks_header = False
+
+    def transform(match):
+        nonlocal spans_tasks_header
+        if match.group(1):
+            return jira_comment
+        if match.group(2):
+            ac_ref = match.group(4)
+            # An unclosed "(AC:" can run onto later lines; the two-pass
+            # version would see the inserted comment inside it instead
+            if ac_ref and "\n## Tasks" in match.group():
+                spans_tasks_header = True
+            return format_task_header(story_id, match.group(2), match.group(3), ac_ref)
+        return f"| T{match.group(5)}-S{match.group(6)} |{match.group(7)}"
+
+    new_content = TASK_REWRITE_RE.sub(transform, content)
+    if spans_tasks_header:
+        return update_subtask_ids(update_tasks_section(content, story_id), story_id)
+    return new_content
+
+
+def script_fingerprint() -> str:
+    """Digest this script; any change to it invalidates the cache."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def process_file(filepath: Path, dry_run: bool = False) -> tuple:
+    """Process a single story file.
+
+    Returns whether the file was (or would be) updated and its progress
+    lines, which main prints so output stays in file order.
+    """
+    lines = []
     content = filepath.read_text()
 
     story_id = extract_story_id(content)
     if not story_id:
-        print(f"  ⚠ Could not extract story ID from {filepath.name}")
-        return False
-
-    print(f"  Processing {filepath.name} (ID: {story_id})")
+        lines.append(f"  ⚠ Could not extract story ID from {filepath.name}")
+        return False, lines
 
-    # Update tasks section
-    new_content = update_tasks_section(content, story_id)
+    lines.append(f"  Processing {filepath.name} (ID: {story_id})")
+    if "<!-- JIRA SYNC:" in content:
+        lines.append("    Already has JIRA SYNC format")
 
-    # Update subtask IDs
-    new_content = update_subtask_ids(new_content, story_id)
+    # Update tasks section and subtask IDs
+    new_content = update_task_ids(content, story_id)
 
     if new_content == content:
-        print(f"    No changes needed")
-        return False
+        lines.append("    No changes needed")
+        return False, lines
 
     if dry_run:
-        print(f"    [DRY RUN] Would update file")
+        lines.append("    [DRY RUN] Would update file")
         # Show diff preview
         old_lines = content.split('\n')
         new_lines = new_content.split('\n')
         for i, (old, new) in enumerate(zip(old_lines, new_lines)):
             if old != new:
-                print(f"      Line {i+1}:")
-                print(f"        - {old[:80]}")
-                print(f"        + {new[:80]}")
+                lines.append(f"      Line {i+1}:")
+                lines.append(f"        - {old[:80]}")
+                lines.append(f"        + {new[:80]}")
                 if i > 5:  # Limit preview
-                    print(f"      ... and more changes")
+                    lines.append("      ... and more changes")
                     break
     else:
         filepath.write_text(new_content)
-        print(f"    ✓ Updated")
+        lines.append("    ✓ Updated")
 
-    return True
+    return True, lines
 
 
 def main():
@@ -156,15 +223,45 @@ def main():
     else:
         files = sorted(IMPL_DIR.glob("auth-*.md"))
 
+    fingerprint = script_fingerprint()
+    cache = load_cache(CACHE_FILE, fingerprint)
+    # Rebuilt from this run's files, so entries for deleted files drop out
+    new_cache = {}
+
+    # Files unchanged since a run that left them alone replay their cached
+    # output; the rest are (re)processed
+    existing = []
+    stale = []
     for filepath in files:
         if not filepath.exists():
             print(f"  ⚠ File not found: {filepath}")
             continue
-
-        if process_file(filepath, args.dry_run):
-            updated += 1
+        stat = filepath.stat()
+        key = str(filepath)
+        cached = cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            new_cache[key] = cached
+            existing.append((key, None, cached[2]))
         else:
-            skipped += 1
+            existing.append((key, stat, None))
+            stale.append(filepath)
+
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(process_file, stale, repeat(args.dry_run), chunksize=CHUNK_SIZE)
+        for key, stat, lines in existing:
+            if stat is None:
+                changed = False
+            else:
+                changed, lines = next(results)
+                if not changed:
+                    new_cache[key] = [stat.st_mtime_ns, stat.st_size, lines]
+            print("\n".join(lines))
+            if changed:
+                updated += 1
+            else:
+                skipped += 1
+
+    save_cache(CACHE_FILE, fingerprint, new_cache)
 
     print("\n" + "=" * 60)
     print("SUMMARY")